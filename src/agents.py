@@ -3,10 +3,32 @@ from typing import Dict, List, Tuple
 import re
 from collections import Counter
 
-STOPWORDS = {
+# below this size the Counter path wins; the JIT kernel only pays off on
+# very large documents (concatenated wikis, 100 KB+ READMEs)
+_NUMBA_MIN_CHARS = 65536
+
+STOPWORDS = frozenset({
     "the", "and", "to", "of", "a", "in", "is", "for", "this", "that", "on", "with",
     "by", "as", "it", "an", "be", "are", "or", "from", "your", "we", "our", "you"
+})
+
+# token = word char start, length >= 3, allowing hyphenated words; \w keeps
+# the baseline's Unicode-aware tokenization (accented words stay whole)
+_WORD_RE = re.compile(r"\w[\w\-]{2,}")
+
+# section/heading patterns, compiled once at import instead of per call
+_TITLE_RE = re.compile(r"^#\s+", re.MULTILINE)
+_H1_RE = re.compile(r"^#\s*(?P<title>.+)$", re.MULTILINE)
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_SECTION_RES = {
+    "installation": re.compile(r"installation", re.IGNORECASE),
+    "usage": re.compile(r"usage", re.IGNORECASE),
+    "contributing": re.compile(r"contributing", re.IGNORECASE),
+    "license": re.compile(r"license", re.IGNORECASE),
+    "examples": re.compile(r"example", re.IGNORECASE),
 }
+_CODE_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
+_HEADING_LINE_RE = re.compile(r"^#{1,6}\s+.*$", re.MULTILINE)
 
 
 def repo_analyzer(readme_text: str) -> Dict:
@@ -16,14 +38,10 @@ def repo_analyzer(readme_text: str) -> Dict:
     """
     text = (readme_text or "").strip()
     tokens = len(text.split())
-    sections = {
-        "title": bool(re.search(r"^#\s+", text, re.MULTILINE)),
-        "installation": bool(re.search(r"(?i)installation", text)),
-        "usage": bool(re.search(r"(?i)usage", text)),
-        "contributing": bool(re.search(r"(?i)contributing", text)),
-        "license": bool(re.search(r"(?i)license", text)),
-        "examples": bool(re.search(r"(?i)example", text)),
-    }
+    sections = {"title": bool(_TITLE_RE.search(text))}
+    sections.update(
+        (name, bool(pattern.search(text))) for name, pattern in _SECTION_RES.items()
+    )
 
     suggestions = []
     if not sections["title"]:
@@ -49,10 +67,67 @@ def repo_analyzer(readme_text: str) -> Dict:
     }
 
 
+def distill_readme(text: str, max_words: int = 400) -> str:
+    """
+    One-shot distillation of a README: title line, lead paragraph, section
+    headings, and a capped excerpt of the remaining prose (code fences are
+    dropped). Computed once per run and reused by the downstream agents so
+    each stage stops re-processing the full raw text.
+
+    The layout deliberately keeps the H1 first and the lead paragraph right
+    after it, so content_improver's title/intro extraction behaves the same
+    on distilled input as on the raw README.
+    """
+    text = (text or "").strip()
+    if not text:
+        return ""
+    body = _CODE_FENCE_RE.sub("", text)
+
+    title_match = _H1_RE.search(body)
+    title_line = title_match.group(0) if title_match else ""
+    after = body[title_match.end():] if title_match else body
+    paras = [p.strip() for p in _PARA_SPLIT_RE.split(after.strip()) if p.strip()]
+    lead = paras[0] if paras else ""
+
+    headings = _HEADING_LINE_RE.findall(body)
+    if title_line and title_line in headings:
+        headings.remove(title_line)
+
+    parts = [p for p in (title_line, lead) if p]
+    if headings:
+        parts.append("\n".join(headings))
+
+    remaining = max_words - sum(len(p.split()) for p in parts)
+    if remaining > 0 and len(paras) > 1:
+        # headings already have their own block above — drop them from the
+        # prose so they are not duplicated (and double-counted) in the excerpt
+        prose = " ".join(_HEADING_LINE_RE.sub("", p) for p in paras[1:])
+        excerpt = " ".join(prose.split()[:remaining])
+        if excerpt:
+            parts.append(excerpt)
+
+    return "\n\n".join(parts)
+
+
 def _simple_keywords(text: str, k: int = 6) -> List[Tuple[str, int]]:
-    text = re.sub(r"[^\w\s]", " ", (text or "").lower())
-    tokens = [t for t in text.split() if t not in STOPWORDS and len(t) > 2]
-    counts = Counter(tokens)
+    text = text or ""
+    if len(text) >= _NUMBA_MIN_CHARS:
+        # deferred: importing kw_numba pulls in numpy/numba and kicks off the
+        # JIT warm thread, so only inputs that cross the threshold pay for it
+        from . import kw_numba
+
+        tokens = [t for t in _WORD_RE.findall(text.lower()) if t not in STOPWORDS]
+        counted = kw_numba.count_tokens(tokens)
+        if counted is not None:
+            return counted[:k]
+        counts = Counter(tokens)
+        return counts.most_common(k)
+
+    # single pass: precompiled regex feeds Counter.update (C level) directly,
+    # instead of substitute + split + per-token dict increments
+    counts = Counter(
+        t for t in _WORD_RE.findall(text.lower()) if t not in STOPWORDS
+    )
     return counts.most_common(k)
 
 
@@ -71,17 +146,17 @@ def content_improver(readme_text: str) -> Dict:
     Keep this simple: pick first heading and suggest a polished version.
     """
     text = (readme_text or "").strip()
-    title_match = re.search(r"^#\s*(.+)$", text, re.MULTILINE)
+    title_match = _H1_RE.search(text)
     first_para = ""
 
     if title_match:
-        title = title_match.group(1).strip()
+        title = title_match.group("title").strip()
     else:
         title = "Project Title"
 
     # find first paragraph after title
     after = text[title_match.end():] if title_match else text
-    paras = re.split(r"\n\s*\n", after.strip())
+    paras = _PARA_SPLIT_RE.split(after.strip())
     if paras:
         first_para = paras[0].strip()
 
@@ -98,31 +173,50 @@ def content_improver(readme_text: str) -> Dict:
     }
 
 
-def reviewer(state: Dict) -> Dict:
+def tag_and_content(readme_text: str) -> Dict:
     """
-    Synthesize outputs from agents into a final actionable report (string).
+    Fused Tag Recommender + Content Improver stage: one call over the same
+    (already distilled) input returning both output blocks. Used by the
+    non-interactive path, where no human gate separates the two agents.
+    """
+    return {
+        "tags": tag_recommender(readme_text),
+        "improvements": content_improver(readme_text),
+    }
+
+
+def reviewer_stream(state: Dict):
+    """
+    Yield the final report line by line as it is synthesized, so callers
+    (CLI, UI) can surface output incrementally instead of waiting for the
+    whole report to be assembled.
     state: expected keys: analyzer, tags, improvements
     """
     analyzer = state.get("analyzer", {})
     tags = state.get("tags", {}).get("tags", [])
     improvements = state.get("improvements", {})
 
-    lines = []
-    lines.append("Final Report — Multi-Agent Publication Reviewer\n")
-    lines.append(analyzer.get("summary", "No analysis available."))
+    yield "Final Report — Multi-Agent Publication Reviewer\n"
+    yield analyzer.get("summary", "No analysis available.")
 
     if analyzer.get("suggestions"):
-        lines.append("\nTop Suggestions:")
+        yield "\nTop Suggestions:"
         for s in analyzer["suggestions"]:
-            lines.append(f" - {s}")
+            yield f" - {s}"
 
     if tags:
-        lines.append("\nSuggested tags: " + ", ".join(tags))
+        yield "\nSuggested tags: " + ", ".join(tags)
 
     if improvements:
-        lines.append("\nContent improvement suggestions:")
-        lines.append(f" * Title: {improvements.get('suggested_title')}")
-        lines.append(f" * Intro (preview): {improvements.get('suggested_intro')}")
+        yield "\nContent improvement suggestions:"
+        yield f" * Title: {improvements.get('suggested_title')}"
+        yield f" * Intro (preview): {improvements.get('suggested_intro')}"
+
 
-    report = "\n".join(lines)
-    return {"report": report}
\ No newline at end of file
+def reviewer(state: Dict) -> Dict:
+    """
+    Synthesize outputs from agents into a final actionable report (string).
+    Buffered wrapper around reviewer_stream for callers that want the
+    whole report at once.
+    """
+    return {"report": "\n".join(reviewer_stream(state))}
\ No newline at end of file
@@ -2,14 +2,28 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
 
 from . import tools
-from .agents import repo_analyzer, tag_recommender, content_improver, reviewer
+from .agents import (
+    content_improver,
+    distill_readme,
+    repo_analyzer,
+    reviewer_stream,
+    tag_and_content,
+    tag_recommender,
+)
+from .sem_cache import SemanticCache, sem_cache_enabled
 from .state import MASState
 from .logging_utils import get_logger
 
@@ -20,6 +34,85 @@ logger = get_logger("app")
 
 load_dotenv()
 
+# orjson encodes large state blobs several times faster than stdlib json;
+# fall back transparently when it is not installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# single-worker pool so output writes overlap with returning to the caller;
+# one worker keeps writes ordered
+_IO_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write to a sibling tmp file and os.replace into place, so an
+    interrupt never leaves a torn output file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def _submit_write(path: Path, data: bytes) -> None:
+    """Queue an atomic write on the I/O pool; failures (permissions, disk
+    full) are logged from a done-callback since nobody waits on the future."""
+
+    def _log_failure(fut) -> None:
+        err = fut.exception()
+        if err is not None:
+            logger.error(f"Failed to write output file {path}: {err}")
+
+    _IO_POOL.submit(_atomic_write, path, data).add_done_callback(_log_failure)
+
+
+# ------------------------------
+# Stage checkpoints (resume after interruption)
+# ------------------------------
+CKPT_DIR = OUTPUTS_DIR / ".ckpt"
+
+
+def _ckpt_path(repo_url: str) -> Path:
+    key = hashlib.sha1(repo_url.encode("utf-8")).hexdigest()
+    return CKPT_DIR / f"{key}.json"
+
+
+def _save_ckpt(path: Path, state: MASState) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, _dumps(state.to_dict()))
+    except Exception as e:
+        logger.warning(f"Failed to write checkpoint: {e}")
+
+
+def _write_outputs(state: MASState, report_text: str):
+    """
+    Save recommendations + report with timestamped filenames. The bytes are
+    built here but the disk writes happen on the I/O pool, so callers return
+    without waiting on the filesystem. Returns (recommendations_path,
+    report_path).
+    """
+    # nanosecond resolution: concurrent runs (batch mode, UI worker pool)
+    # finishing in the same second must not collide on the same filenames
+    ts = str(time.time_ns())
+    rec_f = OUTPUTS_DIR / f"recommendations_{ts}.txt"
+    rpt_f = OUTPUTS_DIR / f"report_{ts}.txt"
+
+    rec_bytes = b"Recommendations (auto-generated state)\n\n" + _dumps(
+        state.to_dict()
+    )
+    _submit_write(rec_f, rec_bytes)
+    _submit_write(rpt_f, report_text.encode("utf-8"))
+    return rec_f, rpt_f
+
 
 # ------------------------------
 # Human-in-the-loop helpers
@@ -80,126 +173,226 @@ def _run_review_core(
     logger.info(f"Starting pipeline for repo: {repo_url}")
     state = MASState()
 
-    print(f"\nFetching README for: {repo_url} ...")
-    try:
-        # IMPORTANT: call through tools.safe_call and tools.fetch_repo_readme
-        # so pytest monkeypatch on tools.fetch_repo_readme works.
-        # NOTE: we DO NOT pass timeout=... here to avoid kwarg mismatch
-        readme = tools.safe_call(
-            tools.fetch_repo_readme,
-            repo_url,
-            tries=3,
-            base_delay=1.0,
-        )
-    except Exception as e:
-        logger.error("Error fetching README", exc_info=True)
-        return {
-            "error": f"Error fetching README: {e}",
-            "recommendations_path": None,
-            "report": "",
-            "report_path": None,
-            "keywords": [],
-        }
-
-    if not readme or not readme.strip():
-        msg = "README content is empty or could not be retrieved."
-        logger.error(msg)
-        return {
-            "error": msg,
-            "recommendations_path": None,
-            "report": "",
-            "report_path": None,
-            "keywords": [],
-        }
-
-    # Store the raw README in state
-    state.set("readme_raw", readme)
+    # Resume support: stages completed by an earlier interrupted run are
+    # loaded back from the per-repo checkpoint so their work (including the
+    # README fetch) is not repeated. The checkpoint is removed when a run
+    # finishes, so completed reviews always start fresh.
+    ckpt_f = _ckpt_path(repo_url)
+    if ckpt_f.exists():
+        try:
+            state.data.update(json.loads(ckpt_f.read_text(encoding="utf-8")))
+            print("\nResuming from checkpoint of a previous interrupted run.")
+            logger.info(f"Resumed state from checkpoint: {ckpt_f}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {ckpt_f}: {e}")
+
+    # prefer the latest human-edited README text if the interrupted run had one
+    readme = (
+        state.get("readme_after_tags_edit")
+        or state.get("readme_after_analyzer_edit")
+        or state.get("readme_raw")
+    )
+    if readme:
+        print(f"\nUsing checkpointed README for: {repo_url}")
+    else:
+        print(f"\nFetching README for: {repo_url} ...")
+        try:
+            # IMPORTANT: call through the tools module attribute so pytest
+            # monkeypatch on tools.fetch_repo_readme works. Retries for
+            # transient HTTP errors live in the shared requests.Session inside
+            # tools, so no safe_call wrapper (with its time.sleep backoff) here.
+            # NOTE: we DO NOT pass timeout=... here to avoid kwarg mismatch
+            readme = tools.fetch_repo_readme(repo_url)
+        except Exception as e:
+            logger.error("Error fetching README", exc_info=True)
+            return {
+                "error": f"Error fetching README: {e}",
+                "recommendations_path": None,
+                "report": "",
+                "report_path": None,
+                "keywords": [],
+            }
+
+        if not readme or not readme.strip():
+            msg = "README content is empty or could not be retrieved."
+            logger.error(msg)
+            return {
+                "error": msg,
+                "recommendations_path": None,
+                "report": "",
+                "report_path": None,
+                "keywords": [],
+            }
+
+        # Store the raw README in state
+        state.set("readme_raw", readme)
+        _save_ckpt(ckpt_f, state)
+
+    # Optional similarity cache (SEM_CACHE=1): near-duplicate READMEs
+    # (forks, minor edits) reuse the stored result instead of re-running
+    # the agents. Only safe in non-interactive mode — interactive runs can
+    # edit intermediate outputs and must not be short-circuited.
+    sem_cache = None
+    if sem_cache_enabled() and not interactive:
+        sem_cache = SemanticCache()
+        score, cached = sem_cache.query(readme)
+        if cached is not None:
+            logger.info(f"Semantic cache hit (similarity {score:.3f}) for {repo_url}")
+            print(f"\nReusing cached review (README similarity {score:.2f}).")
+            return cached
 
     # -----------------------------
     # Stage 1: Repo Analyzer
     # -----------------------------
-    print("\n=== Repo Analyzer ===")
-    analysis = repo_analyzer(readme)
-    state.set("analyzer", analysis)
-
-    print("\nAnalyzer summary:")
-    print(analysis.get("summary"))
-    if analysis.get("suggestions"):
-        print("\nSuggestions:")
-        for s in analysis["suggestions"]:
-            print(" -", s)
-
+    analysis = state.get("analyzer")
+    if analysis is not None:
+        print("\n=== Repo Analyzer (from checkpoint) ===")
+        print(analysis.get("summary"))
+    else:
+        print("\n=== Repo Analyzer ===")
+        analysis = repo_analyzer(readme)
+        state.set("analyzer", analysis)
+        _save_ckpt(ckpt_f, state)
+
+        print("\nAnalyzer summary:")
+        print(analysis.get("summary"))
+        if analysis.get("suggestions"):
+            print("\nSuggestions:")
+            for s in analysis["suggestions"]:
+                print(" -", s)
+
+    # The gate answer is checkpointed separately from the stage output:
+    # a run interrupted while sitting at this prompt resumes by asking it
+    # again instead of silently auto-approving.
     if interactive:
-        choice = ask_human_choice("\nProceed to Tag Recommender?")
-        if choice == "no":
-            print("Pipeline stopped by user.")
-            return {"final_recommendations": "", "keywords": []}
-        if choice == "edit":
-            edited = get_multiline_input(
-                "Edit README excerpt (this will be used by next agents):"
-            )
-            if edited:
-                readme = edited
-                state.set("readme_edited_stage1", True)
-                state.set("readme_after_analyzer_edit", edited)
-                print("Edited README saved for next steps.")
+        if not state.get("gate_analyzer"):
+            choice = ask_human_choice("\nProceed to Tag Recommender?")
+            if choice == "no":
+                print("Pipeline stopped by user.")
+                # deliberate stop, not an interruption — drop the checkpoint
+                # so the next run asks this gate again instead of resuming
+                # past the point the human declined
+                ckpt_f.unlink(missing_ok=True)
+                return {"final_recommendations": "", "keywords": []}
+            if choice == "edit":
+                edited = get_multiline_input(
+                    "Edit README excerpt (this will be used by next agents):"
+                )
+                if edited:
+                    readme = edited
+                    state.set("readme_edited_stage1", True)
+                    state.set("readme_after_analyzer_edit", edited)
+                    print("Edited README saved for next steps.")
+            state.set("gate_analyzer", True)
+            _save_ckpt(ckpt_f, state)
     else:
         print("Non-interactive mode: continuing...")
 
     # -----------------------------
-    # Stage 2: Tag Recommender
+    # Stage 2 + 3: Tag Recommender / Content Improver
     # -----------------------------
-    print("\n=== Tag Recommender ===")
-    tags_out = tag_recommender(readme)
-    state.set("tags", tags_out)
-
-    keywords = tags_out.get("tags", [])
-    if keywords:
-        print("Suggested tags:", ", ".join(keywords))
+    # Distill the README once (title, lead paragraph, headings, capped
+    # excerpt) and feed that to the downstream agents instead of the full
+    # raw text — one pass over the large input instead of one per stage.
+    # Non-interactive mode runs the fused combined stage; interactive mode
+    # keeps the two separate stages with their human approval gates.
+    distilled = distill_readme(readme)
+    state.set("readme_distilled", distilled)
+
+    if not interactive:
+        tags_out = state.get("tags")
+        improvements = state.get("improvements")
+        if tags_out is None or improvements is None:
+            print("\n=== Tag Recommender + Content Improver (combined) ===")
+            combined = tag_and_content(distilled)
+            tags_out = combined["tags"]
+            improvements = combined["improvements"]
+            state.set("tags", tags_out)
+            state.set("improvements", improvements)
+            _save_ckpt(ckpt_f, state)
+        else:
+            print("\n=== Tag Recommender + Content Improver (from checkpoint) ===")
+
+        keywords = tags_out["tags"]
+        if keywords:
+            print("Suggested tags:", ", ".join(keywords))
+        else:
+            print("No tags extracted.")
+        print("Suggested Title:", improvements.get("suggested_title"))
+        print("Suggested Intro (preview):", improvements.get("suggested_intro"))
     else:
-        print("No tags extracted.")
-
-    if interactive:
-        choice = ask_human_choice(
-            "Proceed to Content Improver (title/intro suggestions)?"
-        )
-        if choice == "no":
-            print("Pipeline stopped by user.")
-            return {"final_recommendations": "", "keywords": keywords}
-        if choice == "edit":
-            edited = get_multiline_input(
-                "Edit content (title/intro) to use next:"
+        tags_out = state.get("tags")
+        if tags_out is not None:
+            print("\n=== Tag Recommender (from checkpoint) ===")
+            keywords = tags_out["tags"]
+            if keywords:
+                print("Suggested tags:", ", ".join(keywords))
+        else:
+            print("\n=== Tag Recommender ===")
+            tags_out = tag_recommender(distilled)
+            state.set("tags", tags_out)
+            _save_ckpt(ckpt_f, state)
+
+            keywords = tags_out["tags"]
+            if keywords:
+                print("Suggested tags:", ", ".join(keywords))
+            else:
+                print("No tags extracted.")
+
+        if not state.get("gate_tags"):
+            choice = ask_human_choice(
+                "Proceed to Content Improver (title/intro suggestions)?"
             )
-            if edited:
-                readme = edited
-                state.set("readme_edited_stage2", True)
-                state.set("readme_after_tags_edit", edited)
-                print("Edited content saved for next steps.")
-
-    # -----------------------------
-    # Stage 3: Content Improver
-    # -----------------------------
-    print("\n=== Content Improver ===")
-    improvements = content_improver(readme)
-    state.set("improvements", improvements)
-
-    print("Suggested Title:", improvements.get("suggested_title"))
-    print("Suggested Intro (preview):", improvements.get("suggested_intro"))
-
-    if interactive:
-        choice = ask_human_choice("Proceed to final Reviewer?")
-        if choice == "no":
-            print("Pipeline stopped by user.")
-            return {"final_recommendations": "", "keywords": keywords}
-        if choice == "edit":
-            edited = get_multiline_input(
-                "Edit improved intro/title to use in final report:"
-            )
-            if edited:
-                improvements["suggested_intro"] = edited
-                state.set("improvements", improvements)
-                state.set("intro_edited_stage3", True)
-                print("Edited intro saved.")
+            if choice == "no":
+                print("Pipeline stopped by user.")
+                ckpt_f.unlink(missing_ok=True)
+                return {"final_recommendations": "", "keywords": keywords}
+            if choice == "edit":
+                edited = get_multiline_input(
+                    "Edit content (title/intro) to use next:"
+                )
+                if edited:
+                    readme = edited
+                    # re-distill: the edited text replaces the README downstream
+                    distilled = distill_readme(readme)
+                    state.set("readme_distilled", distilled)
+                    state.set("readme_edited_stage2", True)
+                    state.set("readme_after_tags_edit", edited)
+                    print("Edited content saved for next steps.")
+            state.set("gate_tags", True)
+            _save_ckpt(ckpt_f, state)
+
+        improvements = state.get("improvements")
+        if improvements is not None:
+            print("\n=== Content Improver (from checkpoint) ===")
+            print("Suggested Title:", improvements.get("suggested_title"))
+            print("Suggested Intro (preview):", improvements.get("suggested_intro"))
+        else:
+            print("\n=== Content Improver ===")
+            improvements = content_improver(distilled)
+            state.set("improvements", improvements)
+            _save_ckpt(ckpt_f, state)
+
+            print("Suggested Title:", improvements.get("suggested_title"))
+            print("Suggested Intro (preview):", improvements.get("suggested_intro"))
+
+        if not state.get("gate_improver"):
+            choice = ask_human_choice("Proceed to final Reviewer?")
+            if choice == "no":
+                print("Pipeline stopped by user.")
+                ckpt_f.unlink(missing_ok=True)
+                return {"final_recommendations": "", "keywords": keywords}
+            if choice == "edit":
+                edited = get_multiline_input(
+                    "Edit improved intro/title to use in final report:"
+                )
+                if edited:
+                    improvements["suggested_intro"] = edited
+                    state.set("improvements", improvements)
+                    state.set("intro_edited_stage3", True)
+                    print("Edited intro saved.")
+            state.set("gate_improver", True)
+            _save_ckpt(ckpt_f, state)
 
     # Store human feedback (HITL) in state
     if human_feedback:
@@ -209,27 +402,23 @@ def _run_review_core(
     # Stage 4: Reviewer (aggregation)
     # -----------------------------
     print("\n=== Reviewer: Synthesizing final report ===")
-    report_out = reviewer(state.to_dict())
-    report_text = report_out.get("report", "No report produced.")
+    print("\n--- Final Report ---\n")
+    # stream lines to stdout as the reviewer produces them, so output starts
+    # appearing immediately instead of after the whole report is assembled
+    report_lines = []
+    for line in reviewer_stream(state.to_dict()):
+        print(line)
+        report_lines.append(line)
+    report_text = "\n".join(report_lines) or "No report produced."
 
     # ✅ Ensure human feedback is appended to the final recommendations
     if human_feedback:
-        report_text = f"{report_text}\n\n[Human feedback]\n{human_feedback}"
+        feedback_block = f"\n[Human feedback]\n{human_feedback}"
+        print(feedback_block)
+        report_text = f"{report_text}\n{feedback_block}"
 
-    # Save outputs with timestamped filenames
-    ts = str(int(__import__("time").time()))
-    rec_f = OUTPUTS_DIR / f"recommendations_{ts}.txt"
-    rpt_f = OUTPUTS_DIR / f"report_{ts}.txt"
-
-    with open(rec_f, "w", encoding="utf-8") as fh:
-        fh.write("Recommendations (auto-generated state)\n\n")
-        fh.write(json.dumps(state.to_dict(), indent=2))
-
-    with open(rpt_f, "w", encoding="utf-8") as fh:
-        fh.write(report_text)
+    rec_f, rpt_f = _write_outputs(state, report_text)
 
-    print("\n--- Final Report ---\n")
-    print(report_text)
     print(f"\nSaved recommendations to: {rec_f}")
     print(f"Saved final report to: {rpt_f}")
 
@@ -239,7 +428,7 @@ def _run_review_core(
         rpt_f,
     )
 
-    return {
+    result = {
         "final_recommendations": report_text,
         "recommendations_path": str(rec_f),
         "report": report_text,
@@ -247,6 +436,14 @@ def _run_review_core(
         "keywords": keywords,
     }
 
+    if sem_cache is not None:
+        sem_cache.add(readme, result)
+
+    # run completed — drop the checkpoint so the next review starts fresh
+    ckpt_f.unlink(missing_ok=True)
+
+    return result
+
 
 # ------------------------------
 # Public API used by tests & UI
@@ -270,6 +467,229 @@ def run_review_workflow(
     )
 
 
+def fetch_and_analyze(
+    repo_url: str,
+    model_name: str = "gemini-2.5-flash",
+    readme: Optional[str] = None,
+) -> dict:
+    """
+    The cacheable half of the workflow: fetch the README and run the
+    analysis agents. A pure function of (repo_url, model_name) — human
+    feedback is not involved — so UIs can cache the result while HITL
+    notes vary between reruns. Raises on fetch failure. Callers that
+    already hold the README text can pass it to skip the fetch.
+    """
+    if readme is None:
+        # call through the tools module attribute so monkeypatching works
+        readme = tools.fetch_repo_readme(repo_url)
+    if not readme or not readme.strip():
+        raise RuntimeError("README content is empty or could not be retrieved.")
+
+    distilled = distill_readme(readme)
+    combined = tag_and_content(distilled)
+    return {
+        "readme_raw": readme,
+        "readme_distilled": distilled,
+        "analyzer": repo_analyzer(readme),
+        "tags": combined["tags"],
+        "improvements": combined["improvements"],
+        "keywords": combined["tags"]["tags"],
+    }
+
+
+def _state_from_analysis(analysis: dict) -> MASState:
+    state = MASState()
+    for key in ("readme_raw", "readme_distilled", "analyzer", "tags", "improvements"):
+        state.set(key, analysis[key])
+    return state
+
+
+def compose_recommendations(analysis: dict, human_feedback: Optional[str] = "") -> dict:
+    """
+    The cheap, per-request half: synthesize the final report from a
+    fetch_and_analyze result plus the (varying) human feedback, and write
+    the output files. Deliberately not cacheable — HITL notes change
+    between runs.
+    """
+    state = _state_from_analysis(analysis)
+    if human_feedback:
+        state.set("human_feedback", human_feedback)
+
+    report_text = "\n".join(reviewer_stream(state.to_dict())) or "No report produced."
+    if human_feedback:
+        report_text = f"{report_text}\n\n[Human feedback]\n{human_feedback}"
+
+    rec_f, rpt_f = _write_outputs(state, report_text)
+    return {
+        "final_recommendations": report_text,
+        "recommendations_path": str(rec_f),
+        "report": report_text,
+        "report_path": str(rpt_f),
+        "keywords": analysis["keywords"],
+    }
+
+
+async def run_review_workflow_async(
+    repo_url: str,
+    human_feedback: Optional[str] = "",
+    model_name: str = "gemini-2.5-flash",
+) -> dict:
+    """
+    Async facade over the split workflow for event-loop callers (batch
+    mode). The blocking README fetch + analysis half runs in a worker
+    thread so the loop stays free to overlap other repos' I/O; the
+    composition half is cheap and runs inline. SEM_CACHE=1 is honored
+    the same way as in the sync non-interactive path: near-duplicate
+    READMEs reuse the stored result instead of re-running the agents.
+    """
+
+    def _run_with_sem_cache() -> dict:
+        sem_cache = SemanticCache()
+        readme = tools.fetch_repo_readme(repo_url)
+        score, cached = sem_cache.query(readme)
+        if cached is not None:
+            logger.info(f"Semantic cache hit (similarity {score:.3f}) for {repo_url}")
+            return cached
+        analysis = fetch_and_analyze(repo_url, model_name, readme=readme)
+        result = compose_recommendations(analysis, human_feedback)
+        sem_cache.add(readme, result)
+        return result
+
+    try:
+        if sem_cache_enabled():
+            return await asyncio.to_thread(_run_with_sem_cache)
+        analysis = await asyncio.to_thread(fetch_and_analyze, repo_url, model_name)
+    except Exception as e:
+        logger.error("Error fetching README", exc_info=True)
+        return {
+            "error": f"Error fetching README: {e}",
+            "recommendations_path": None,
+            "report": "",
+            "report_path": None,
+            "keywords": [],
+        }
+    return compose_recommendations(analysis, human_feedback)
+
+
+def run_review_workflow_stream(
+    repo_url: str,
+    human_feedback: Optional[str] = "",
+    model_name: str = "gemini-2.5-flash",
+    analysis: Optional[dict] = None,
+    cancel: Optional[threading.Event] = None,
+):
+    """
+    Event-stream variant of run_review_workflow for UIs. Pass a
+    fetch_and_analyze result as `analysis` to skip the fetch/analysis half
+    (e.g. when the UI has it cached) and stream only the composition.
+
+    Pass a threading.Event as `cancel` to make the run abandonable: it is
+    checked between stages and between report lines, and a set event ends
+    the stream with a {"cancelled": True} event — no outputs are written.
+
+    Yields dict events as the pipeline progresses:
+        {"stage": str}      — a stage is starting
+        {"keywords": list}  — suggested tags are ready
+        {"delta": str}      — next chunk of the final report
+        {"cancelled": True} — terminal; the cancel event was set
+        {"error": str}      — terminal failure
+        {"final": dict}     — terminal success; same shape as
+                              run_review_workflow's return value
+    """
+    logger.info(f"Starting streaming pipeline for repo: {repo_url}")
+
+    def _cancelled() -> bool:
+        if cancel is not None and cancel.is_set():
+            logger.info(f"Pipeline cancelled for repo: {repo_url}")
+            return True
+        return False
+
+    if analysis is None:
+        if _cancelled():
+            yield {"cancelled": True}
+            return
+        yield {"stage": "Fetching and analyzing README"}
+        try:
+            analysis = fetch_and_analyze(repo_url, model_name)
+        except Exception as e:
+            logger.error("Error fetching README", exc_info=True)
+            yield {"error": f"Error fetching README: {e}"}
+            return
+    yield {"keywords": analysis["keywords"]}
+
+    if _cancelled():
+        yield {"cancelled": True}
+        return
+    yield {"stage": "Synthesizing final report"}
+    state = _state_from_analysis(analysis)
+    if human_feedback:
+        state.set("human_feedback", human_feedback)
+
+    report_lines = []
+    for line in reviewer_stream(state.to_dict()):
+        if _cancelled():
+            yield {"cancelled": True}
+            return
+        report_lines.append(line)
+        yield {"delta": line + "\n"}
+    report_text = "\n".join(report_lines) or "No report produced."
+
+    if human_feedback:
+        feedback_block = f"\n[Human feedback]\n{human_feedback}"
+        report_text = f"{report_text}\n{feedback_block}"
+        yield {"delta": feedback_block + "\n"}
+
+    rec_f, rpt_f = _write_outputs(state, report_text)
+    logger.info("Streaming pipeline complete. Outputs: %s and %s", rec_f, rpt_f)
+
+    yield {
+        "final": {
+            "final_recommendations": report_text,
+            "recommendations_path": str(rec_f),
+            "report": report_text,
+            "report_path": str(rpt_f),
+            "keywords": analysis["keywords"],
+        }
+    }
+
+
+class ReviewWorkflow:
+    """
+    Reusable per-model workflow handle: build once, run per request.
+
+    There is no heavyweight graph or LLM client to construct in this
+    pipeline today, but the handle gives UIs a stable object to cache
+    (e.g. st.cache_resource keyed by model name) so per-request inputs are
+    the only thing that changes between runs — and any future per-model
+    setup cost lands in build_workflow, paid once.
+    """
+
+    def __init__(self, model_name: str = "gemini-2.5-flash"):
+        self.model_name = model_name
+
+    def run(self, repo_url: str, human_feedback: Optional[str] = "") -> dict:
+        return run_review_workflow(repo_url, human_feedback, self.model_name)
+
+    def analyze(self, repo_url: str) -> dict:
+        return fetch_and_analyze(repo_url, self.model_name)
+
+    def stream(
+        self,
+        repo_url: str,
+        human_feedback: Optional[str] = "",
+        analysis: Optional[dict] = None,
+        cancel: Optional[threading.Event] = None,
+    ):
+        return run_review_workflow_stream(
+            repo_url, human_feedback, self.model_name, analysis=analysis, cancel=cancel
+        )
+
+
+def build_workflow(model_name: str = "gemini-2.5-flash") -> ReviewWorkflow:
+    """Factory for a reusable workflow handle; see ReviewWorkflow."""
+    return ReviewWorkflow(model_name)
+
+
 # ------------------------------
 # CLI entrypoint
 # ------------------------------
@@ -281,7 +701,18 @@ def main():
         "--repo",
         type=str,
         help="GitHub repo URL to analyze",
-        required=True,
+    )
+    parser.add_argument(
+        "--repos-file",
+        type=str,
+        help="Newline-delimited file of repo URLs to review in batch "
+        "(non-interactive, bounded concurrency).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Max repos reviewed in parallel with --repos-file.",
     )
     parser.add_argument(
         "--no-interactive",
@@ -309,6 +740,20 @@ def main():
 
     args = parser.parse_args()
 
+    if args.repos_file:
+        from .batch import run_many_sync
+
+        urls = [
+            line.strip()
+            for line in Path(args.repos_file).read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        run_many_sync(urls, concurrency=args.concurrency)
+        return
+
+    if not args.repo:
+        parser.error("one of --repo or --repos-file is required")
+
     _run_review_core(
         repo_url=args.repo,
         human_feedback=args.human_feedback,
@@ -0,0 +1,38 @@
+# src/batch.py
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from .app import run_review_workflow_async
+from .logging_utils import get_logger
+
+logger = get_logger("batch")
+
+
+async def run_many(repo_urls: List[str], concurrency: int = 4) -> List[dict]:
+    """
+    Review several repositories concurrently, at most `concurrency` at a
+    time. Each review runs the non-interactive workflow end to end,
+    including the SEM_CACHE similarity cache when enabled; the per-repo
+    checkpoint/resume mechanism is not used here — a failed repo simply
+    reports its error and can be re-run. The semaphore bounds how many
+    reviews are in flight so we stay polite to the GitHub API.
+
+    Returns one result dict per URL, in input order.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> dict:
+        async with sem:
+            return await run_review_workflow_async(url)
+
+    logger.info(
+        f"Batch review of {len(repo_urls)} repos (concurrency={concurrency})"
+    )
+    return await asyncio.gather(*(one(u) for u in repo_urls))
+
+
+def run_many_sync(repo_urls: List[str], concurrency: int = 4) -> List[dict]:
+    """Blocking convenience wrapper for CLI use."""
+    return asyncio.run(run_many(repo_urls, concurrency=concurrency))
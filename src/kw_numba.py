@@ -0,0 +1,91 @@
+# src/kw_numba.py
+"""
+Optional Numba-accelerated token counting for very large READMEs.
+
+The pure-Python Counter path in agents._simple_keywords is fine for typical
+READMEs, but for 100 KB+ documents the per-token work adds up. When numba
+and numpy are importable, tokens are pre-hashed into an int64 array and
+counted by a JIT-compiled open-addressing kernel; otherwise count_tokens
+returns None and callers keep the Counter path.
+"""
+from __future__ import annotations
+
+import threading
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # numba/numpy are optional; fall back silently
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, nogil=True)
+    def _count_hashed(hashes):
+        n = hashes.size
+        cap = 8
+        while cap < n * 2:
+            cap <<= 1
+        mask = cap - 1
+        keys = np.zeros(cap, np.int64)
+        vals = np.zeros(cap, np.int64)
+        used = np.zeros(cap, np.uint8)
+        for i in range(n):
+            h = hashes[i]
+            j = h & mask
+            while used[j] and keys[j] != h:
+                j = (j + 1) & mask
+            keys[j] = h
+            used[j] = 1
+            vals[j] += 1
+        m = 0
+        for j in range(cap):
+            if used[j]:
+                m += 1
+        out_keys = np.empty(m, np.int64)
+        out_vals = np.empty(m, np.int64)
+        t = 0
+        for j in range(cap):
+            if used[j]:
+                out_keys[t] = keys[j]
+                out_vals[t] = vals[j]
+                t += 1
+        return out_keys, out_vals
+
+    def _warm() -> None:
+        # trigger (or load the on-disk cache of) the JIT compile off the
+        # import path so the first real call does not pay for it
+        try:
+            _count_hashed(np.array([1, 2, 2], dtype=np.int64))
+        except Exception:
+            pass
+
+    threading.Thread(target=_warm, daemon=True).start()
+
+
+def count_tokens(tokens: List[str]) -> Optional[List[Tuple[str, int]]]:
+    """
+    Count token frequencies with the JIT kernel.
+
+    Returns (token, count) pairs sorted by descending count, or None when
+    the accelerated path is unavailable so callers can fall back.
+    """
+    if not _HAS_NUMBA or not tokens:
+        return None
+
+    words: dict = {}
+    hashes = np.empty(len(tokens), dtype=np.int64)
+    for i, tok in enumerate(tokens):
+        h = hash(tok)
+        hashes[i] = h
+        if h not in words:
+            words[h] = tok
+
+    keys, vals = _count_hashed(hashes)
+    pairs = [(words[int(k)], int(v)) for k, v in zip(keys, vals)]
+    pairs.sort(key=lambda kv: kv[1], reverse=True)
+    return pairs
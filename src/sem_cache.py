@@ -0,0 +1,91 @@
+# src/sem_cache.py
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+SEM_CACHE_PATH = Path(__file__).resolve().parent.parent / "outputs" / ".sem_cache.json"
+
+_TOKEN_RE = re.compile(r"[a-z0-9\-]{3,}")
+
+
+def _vectorize(text: str) -> Counter:
+    """Bag-of-words term-frequency vector for similarity lookups."""
+    return Counter(_TOKEN_RE.findall((text or "").lower()))
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    # iterate the smaller vector for the dot product
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[token] for token, count in a.items())
+    if not dot:
+        return 0.0
+    norm_a = math.sqrt(sum(c * c for c in a.values()))
+    norm_b = math.sqrt(sum(c * c for c in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+class SemanticCache:
+    """
+    Similarity cache over README text: near-duplicate READMEs (forks, minor
+    edits) reuse the stored pipeline result instead of re-running the agents.
+
+    Entries are (term-frequency vector, payload) pairs persisted as JSON
+    under outputs/. Lookup is a linear scan with cosine similarity, which is
+    plenty for the tens-of-entries scale this cache sees.
+    """
+
+    def __init__(self, threshold: float = 0.95, path: Path = SEM_CACHE_PATH):
+        self.threshold = threshold
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self) -> list:
+        if not self.path.exists():
+            return []
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache: {e}")
+            return []
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.entries), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to persist semantic cache: {e}")
+
+    def query(self, text: str) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """Return (best_score, payload) — payload is None below threshold."""
+        vec = _vectorize(text)
+        best_score, best_payload = 0.0, None
+        for entry in self.entries:
+            score = _cosine(vec, Counter(entry["vector"]))
+            if score > best_score:
+                best_score, best_payload = score, entry["payload"]
+        if best_score >= self.threshold:
+            return best_score, best_payload
+        return best_score, None
+
+    def add(self, text: str, payload: Dict[str, Any]) -> None:
+        self.entries.append({"vector": dict(_vectorize(text)), "payload": payload})
+        self._save()
+
+
+def sem_cache_enabled() -> bool:
+    return os.environ.get("SEM_CACHE", "") == "1"
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from typing import List, Optional
+import functools
+import hashlib
+import io
+import json
+import os
 import re
-import textwrap
 import time
-
-import requests
-import yake
-from markdown_it import MarkdownIt
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
 
 from .logging_utils import get_logger
 
@@ -18,30 +20,131 @@ logger = get_logger(__name__)
 GITHUB_API_README = "https://api.github.com/repos/{owner}/{repo}/readme"
 RAW_README = "https://raw.githubusercontent.com/{owner}/{repo}/{branch}/README.md"
 
+# -------------------------------------------------------------------
+# Shared HTTP session: connection pooling amortizes TLS handshakes across
+# the API + raw-branch fallback requests, and urllib3-native retries with
+# backoff replace Python-level sleep loops for transient HTTP errors.
+# Built on first use so importing src.tools (e.g. for validate_repo_url
+# in the UI shell) does not pay for the requests/urllib3 import chain.
+# -------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        ),
+    )
+    return session
+
+# -------------------------------------------------------------------
+# On-disk README cache (opt-in via README_CACHE=1)
+# -------------------------------------------------------------------
+README_CACHE_DIR = Path(__file__).resolve().parent.parent / "outputs" / ".readme_cache"
+README_CACHE_TTL = 24 * 3600  # seconds; override with README_CACHE_TTL env var
+
+# in-process layer so repeat lookups within one run skip the disk entirely
+_readme_mem_cache: dict = {}
+
+
+def _readme_cache_enabled() -> bool:
+    return os.environ.get("README_CACHE", "") == "1"
+
+
+def _readme_cache_path(repo_url: str) -> Path:
+    key = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()
+    return README_CACHE_DIR / f"{key}.json"
+
+
+def _readme_cache_get(repo_url: str) -> Optional[str]:
+    if repo_url in _readme_mem_cache:
+        return _readme_mem_cache[repo_url]
+
+    path = _readme_cache_path(repo_url)
+    if not path.exists():
+        return None
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        ttl = int(os.environ.get("README_CACHE_TTL", README_CACHE_TTL))
+        if time.time() - entry.get("ts", 0) > ttl:
+            return None
+        content = entry["content"]
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable README cache entry: {e}")
+        return None
+
+    _readme_mem_cache[repo_url] = content
+    return content
+
+
+def _readme_cache_put(repo_url: str, content: str) -> None:
+    _readme_mem_cache[repo_url] = content
+    try:
+        README_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _readme_cache_path(repo_url)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"repo_url": repo_url, "content": content, "ts": time.time()}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)  # atomic: no torn files on interrupt
+    except Exception as e:
+        logger.warning(f"Failed to write README cache entry: {e}")
+
 
 # -------------------------------------------------------------------
 # Validation & Safety Helpers
 # -------------------------------------------------------------------
+# compiled once at import so hot callers skip the re._compile cache lookup
+_REPO_URL_RE = re.compile(r"^https://github\.com/[^/]+/[^/]+/?$")
+_WS_RE = re.compile(r"\s+")
+
+# strips C0 control chars + DEL in one C-level pass; the \s characters
+# (\t\n\v\f\r) are left for the whitespace collapse to turn into single
+# spaces, so control whitespace still separates words instead of gluing them
+_CTRL_TABLE = {c: None for c in range(32) if c not in (9, 10, 11, 12, 13)}
+_CTRL_TABLE[127] = None
+
+
+@functools.lru_cache(maxsize=256)
 def validate_repo_url(url: str) -> bool:
     """
     Basic validation for GitHub repo URLs.
     Accepts: https://github.com/owner/repo
+
+    Memoized: Streamlit reruns re-validate the same URL on every widget
+    interaction, so repeat lookups skip the regex entirely.
     """
     if not url:
         return False
-    url = url.strip()
-    pattern = r"^https://github\.com/[^/]+/[^/]+/?$"
-    return bool(re.match(pattern, url))
+    return bool(_REPO_URL_RE.match(url.strip()))
 
 
 def sanitize_text(text: str, max_len: int = 4000) -> str:
     """
-    Light guardrail: trim very long outputs and normalize whitespace.
+    Light guardrail: trim very long outputs, drop control characters, and
+    normalize whitespace.
+
+    Truncates before sanitizing (to a 2x max_len working slice, leaving
+    headroom for whitespace runs that collapse), so the cost is bounded by
+    what the caller will actually display rather than the input size.
     """
     if not text:
         return ""
-    text = text.strip()
-    text = re.sub(r"\s+", " ", text)
+    text = text[: max_len * 2].strip()
+    text = text.translate(_CTRL_TABLE)
+    text = _WS_RE.sub(" ", text)
     if len(text) > max_len:
         text = text[: max_len - 3] + "..."
     return text
@@ -50,43 +153,77 @@ def sanitize_text(text: str, max_len: int = 4000) -> str:
 # -------------------------------------------------------------------
 # Your original helpers (now with logging)
 # -------------------------------------------------------------------
+def _parse_owner_repo(repo_url: str) -> tuple:
+    """
+    Extract (owner, repo) from the URL shapes we see in practice:
+        https://github.com/owner/repo
+        https://github.com/owner/repo/tree/main/docs
+        https://github.com/owner/repo/blob/main/README.md
+        git@github.com:owner/repo.git
+    Trailing /tree/<branch>/... and /blob/<branch>/... segments are ignored.
+    """
+    path = repo_url.strip()
+    if path.startswith("git@"):
+        path = path.split(":", 1)[1]
+    else:
+        path = re.sub(r"^https?://[^/]+/", "", path)
+    parts = [p for p in path.strip("/").split("/") if p]
+    owner, repo = parts[0], parts[1]
+    return owner, repo.removesuffix(".git")
+
+
 def fetch_readme_via_api(repo_url: str, timeout: int = 10) -> Optional[str]:
     """
-    Try the GitHub API (returns raw content when requested).
+    Fetch the README via the GitHub API and the raw main/master URLs.
     repo_url examples:
         https://github.com/owner/repo
         git@github.com:owner/repo.git
+
+    The three candidate URLs are independent, so they are requested
+    concurrently and the first non-empty 200 wins — total wall-clock is
+    max() of the three latencies instead of their sum.
     """
     try:
-        parts = repo_url.rstrip("/").split("/")
-        owner = parts[-2]
-        repo = parts[-1].replace(".git", "")
+        owner, repo = _parse_owner_repo(repo_url)
     except Exception as e:
         logger.error(f"Failed to parse repo URL '{repo_url}': {e}")
         return None
 
-    url = GITHUB_API_README.format(owner=owner, repo=repo)
-    headers = {"Accept": "application/vnd.github.v3.raw"}
+    candidates = [
+        (
+            GITHUB_API_README.format(owner=owner, repo=repo),
+            {"Accept": "application/vnd.github.v3.raw"},
+        ),
+        (RAW_README.format(owner=owner, repo=repo, branch="main"), {}),
+        (RAW_README.format(owner=owner, repo=repo, branch="master"), {}),
+    ]
 
+    logger.info(f"Fetching README concurrently from {len(candidates)} URLs for {repo_url}")
+    # no `with` block: the executor's __exit__ would join the still-running
+    # losers, making the "first winner" wait for the slowest request anyway.
+    # shutdown(wait=False) lets the winner return immediately; loser threads
+    # finish their in-flight request in the background and are then reaped.
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
     try:
-        logger.info(f"Fetching README via GitHub API: {url}")
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        if resp.status_code == 200 and resp.text.strip():
-            return resp.text
-    except Exception as e:
-        logger.warning(f"GitHub API fetch failed, will try raw URLs: {e}")
-
-    # fallback: direct raw README on main and master
-    for branch in ("main", "master"):
-        raw_url = RAW_README.format(owner=owner, repo=repo, branch=branch)
-        try:
-            logger.info(f"Trying raw README at: {raw_url}")
-            r2 = requests.get(raw_url, timeout=timeout)
-            if r2.status_code == 200 and r2.text.strip():
-                return r2.text
-        except Exception as e:
-            logger.warning(f"Raw README fetch failed for branch {branch}: {e}")
-            continue
+        pending = {
+            pool.submit(_get_session().get, url, headers=headers, timeout=timeout): url
+            for url, headers in candidates
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                url = pending.pop(fut)
+                try:
+                    resp = fut.result()
+                    if resp.status_code == 200 and resp.text.strip():
+                        return resp.text
+                    logger.warning(
+                        f"README fetch returned {resp.status_code} for: {url}"
+                    )
+                except Exception as e:
+                    logger.warning(f"README fetch failed for {url}: {e}")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     logger.error(f"Unable to fetch README for repo: {repo_url}")
     return None
@@ -95,6 +232,9 @@ def fetch_readme_via_api(repo_url: str, timeout: int = 10) -> Optional[str]:
 def safe_call(func, *args, tries: int = 3, base_delay: float = 1.0, **kwargs):
     """
     Generic retry helper with exponential backoff.
+
+    HTTP requests are retried natively by the shared session's urllib3
+    Retry; keep this only for non-HTTP callables.
     """
     last_err = None
     delay = base_delay
@@ -115,24 +255,45 @@ def safe_call(func, *args, tries: int = 3, base_delay: float = 1.0, **kwargs):
 # -------------------------------------------------------------------
 def fetch_repo_readme(repo_url: str, timeout: int = 10) -> str:
     """
-    Validates the URL, then uses your API+raw fallback approach with retries.
+    Validates the URL, then uses your API+raw fallback approach; retries for
+    transient HTTP errors are handled by the shared session's Retry config.
     Raises a clear error if README cannot be retrieved.
     """
     if not validate_repo_url(repo_url):
         raise ValueError("Invalid GitHub repo URL. Expected https://github.com/owner/repo")
 
+    if _readme_cache_enabled():
+        cached = _readme_cache_get(repo_url)
+        if cached:
+            logger.info(f"README cache hit for repo: {repo_url}")
+            return cached
+
     logger.info(f"Fetching README for repo: {repo_url}")
-    content = safe_call(fetch_readme_via_api, repo_url, timeout=timeout)
+    content = fetch_readme_via_api(repo_url, timeout=timeout)
 
     if not content or not content.strip():
         raise RuntimeError("README content is empty or could not be retrieved.")
 
-    return content.strip()
+    content = content.strip()
+    if _readme_cache_enabled():
+        _readme_cache_put(repo_url, content)
+    return content
 
 
 # -------------------------------------------------------------------
 # Keyword Extraction
 # -------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def _get_yake_extractor(top_k: int):
+    """Build (once per top_k) and reuse the YAKE extractor: its constructor
+    loads stopword tables and compiles patterns, which dominates on small
+    inputs when called repeatedly. Import stays deferred — YAKE is only
+    loaded for entrypoints that actually extract keywords."""
+    import yake
+
+    return yake.KeywordExtractor(top=top_k, stopwords=None)
+
+
 def extract_keywords(text: str, top_k: int = 10) -> List[str]:
     """
     Simple YAKE-based keyword extraction from README / repo text.
@@ -141,27 +302,50 @@ def extract_keywords(text: str, top_k: int = 10) -> List[str]:
     if not text.strip():
         return []
 
-    kw_extractor = yake.KeywordExtractor(top=top_k, stopwords=None)
+    kw_extractor = _get_yake_extractor(top_k)
     keywords = kw_extractor.extract_keywords(text)
     # YAKE returns list of (keyword, score); we only need keyword string
     return [k for k, _ in keywords]
 
 
+# -------------------------------------------------------------------
+# README structure helpers
+# -------------------------------------------------------------------
+_HEADING_RE = re.compile(r"^#{1,6}\s+(?P<title>.*)$", re.MULTILINE)
+
+
+def lint_readme_sections(text: str) -> List[str]:
+    """
+    Return the markdown heading titles found in the README, in order.
+    """
+    return [m.group("title").strip() for m in _HEADING_RE.finditer(text or "")]
+
+
 # -------------------------------------------------------------------
 # Markdown → Plain Text
 # -------------------------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """One parser, built on first use: markdown_it import and MarkdownIt
+    construction stay off the module import path, and the parser is
+    stateless across parse() calls so a single instance is safe to share."""
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt()
+
+
 def markdown_to_text(md: str) -> str:
     """
     Convert README markdown to plain text for LLM consumption.
     """
     if not md:
         return ""
-    md = md.strip()
-    parser = MarkdownIt()
-    tokens = parser.parse(md)
-    lines: List[str] = []
-    for t in tokens:
+    # stream token contents straight into a buffer — no intermediate list of
+    # per-token strings, and no dedent pass (inline tokens carry no leading
+    # whitespace)
+    buf = io.StringIO()
+    for t in _get_parser().parse(md.strip()):
         if t.type == "inline" and t.content:
-            lines.append(t.content)
-    out = "\n".join(lines)
-    return textwrap.dedent(out).strip()
\ No newline at end of file
+            buf.write(t.content)
+            buf.write("\n")
+    return buf.getvalue().strip()
\ No newline at end of file
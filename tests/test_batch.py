@@ -0,0 +1,37 @@
+import src.tools as tools
+from src.batch import run_many_sync
+
+
+def test_run_many_returns_results_in_input_order(monkeypatch):
+    def fake_fetch(repo_url):
+        name = repo_url.rstrip("/").split("/")[-1]
+        return f"# {name}\n\nREADME for {name} used in the batch test."
+
+    monkeypatch.setattr(tools, "fetch_repo_readme", fake_fetch)
+
+    urls = [
+        "https://github.com/owner/batch-one",
+        "https://github.com/owner/batch-two",
+        "https://github.com/owner/batch-three",
+    ]
+    results = run_many_sync(urls, concurrency=2)
+
+    assert len(results) == len(urls)
+    for url, result in zip(urls, results):
+        name = url.rsplit("/", 1)[-1]
+        assert name in result["final_recommendations"]
+
+
+def test_run_many_reports_per_repo_errors(monkeypatch):
+    def fake_fetch(repo_url):
+        if repo_url.endswith("broken"):
+            raise RuntimeError("boom")
+        return "# OK\n\nA fine README."
+
+    monkeypatch.setattr(tools, "fetch_repo_readme", fake_fetch)
+
+    results = run_many_sync(
+        ["https://github.com/owner/fine", "https://github.com/owner/broken"]
+    )
+    assert "final_recommendations" in results[0]
+    assert "error" in results[1]
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+import src.tools as tools
+from src.app import _ckpt_path, run_review_workflow
+
+
+REPO_URL = "https://github.com/owner/ckpt-repo"
+
+
+@pytest.fixture
+def clean_ckpt():
+    ckpt = _ckpt_path(REPO_URL)
+    ckpt.unlink(missing_ok=True)
+    yield ckpt
+    ckpt.unlink(missing_ok=True)
+
+
+def test_resume_skips_refetch_and_clears_checkpoint(monkeypatch, clean_ckpt):
+    # an interrupted run left a checkpoint with the README already fetched;
+    # the resumed run must not hit the network at all
+    clean_ckpt.parent.mkdir(parents=True, exist_ok=True)
+    clean_ckpt.write_text(
+        json.dumps({"readme_raw": "# Checkpointed\n\nREADME from the first run."}),
+        encoding="utf-8",
+    )
+
+    def explode(repo_url):
+        raise AssertionError("resume must not refetch the README")
+
+    monkeypatch.setattr(tools, "fetch_repo_readme", explode)
+
+    result = run_review_workflow(REPO_URL)
+    assert result["final_recommendations"]
+    # completed runs drop the checkpoint so the next review starts fresh
+    assert not clean_ckpt.exists()
+
+
+def test_completed_run_leaves_no_checkpoint(monkeypatch, clean_ckpt):
+    monkeypatch.setattr(
+        tools, "fetch_repo_readme", lambda repo_url: "# Fresh\n\nA fresh README."
+    )
+
+    result = run_review_workflow(REPO_URL)
+    assert result["final_recommendations"]
+    assert not clean_ckpt.exists()
@@ -0,0 +1,62 @@
+import threading
+
+import src.tools as tools
+from src.app import run_review_workflow_stream
+
+
+def dummy_readme() -> str:
+    return """
+# Dummy Project
+
+This is a sample README for testing the streaming workflow.
+
+## Usage
+
+Run the thing.
+"""
+
+
+def test_stream_yields_stages_deltas_and_final(monkeypatch):
+    monkeypatch.setattr(tools, "fetch_repo_readme", lambda repo_url: dummy_readme())
+
+    events = list(run_review_workflow_stream("https://github.com/owner/stream-repo"))
+
+    stages = [e["stage"] for e in events if "stage" in e]
+    assert "Fetching and analyzing README" in stages
+    assert "Synthesizing final report" in stages
+    assert any("delta" in e for e in events)
+    assert "final" in events[-1]
+    final = events[-1]["final"]
+    assert final["final_recommendations"]
+    assert "".join(e["delta"] for e in events if "delta" in e).strip() in (
+        final["report"]
+    )
+
+
+def test_stream_cancel_before_start(monkeypatch):
+    monkeypatch.setattr(tools, "fetch_repo_readme", lambda repo_url: dummy_readme())
+
+    cancel = threading.Event()
+    cancel.set()
+    events = list(
+        run_review_workflow_stream(
+            "https://github.com/owner/stream-repo", cancel=cancel
+        )
+    )
+    assert events == [{"cancelled": True}]
+
+
+def test_stream_cancel_mid_run_is_terminal(monkeypatch):
+    monkeypatch.setattr(tools, "fetch_repo_readme", lambda repo_url: dummy_readme())
+
+    cancel = threading.Event()
+    events = []
+    for ev in run_review_workflow_stream(
+        "https://github.com/owner/stream-repo", cancel=cancel
+    ):
+        events.append(ev)
+        if "delta" in ev:
+            cancel.set()
+
+    assert events[-1] == {"cancelled": True}
+    assert not any("final" in e for e in events)
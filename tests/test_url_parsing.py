@@ -0,0 +1,24 @@
+from src.tools import _parse_owner_repo
+
+
+def test_parse_plain_https_url():
+    assert _parse_owner_repo("https://github.com/owner/repo") == ("owner", "repo")
+
+
+def test_parse_trailing_slash():
+    assert _parse_owner_repo("https://github.com/owner/repo/") == ("owner", "repo")
+
+
+def test_parse_tree_and_blob_paths():
+    assert _parse_owner_repo("https://github.com/owner/repo/tree/main/docs") == (
+        "owner",
+        "repo",
+    )
+    assert _parse_owner_repo("https://github.com/owner/repo/blob/main/README.md") == (
+        "owner",
+        "repo",
+    )
+
+
+def test_parse_ssh_url_strips_git_suffix():
+    assert _parse_owner_repo("git@github.com:owner/repo.git") == ("owner", "repo")
@@ -2,18 +2,24 @@
 
 import os
 import sys
-
-# Make project root importable as a package
-ROOT = os.path.dirname(os.path.dirname(__file__))
-if ROOT not in sys.path:
-    sys.path.append(ROOT)
-
-from pathlib import Path  # (currently not used, but harmless if you want to log paths)
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Make project root importable as a package. Streamlit re-executes this
+# script on every widget interaction, so the path computation and the linear
+# sys.path membership scan are guarded by a process-level env flag: after the
+# first run (per process) this is a single dict lookup. The env flag also
+# keeps symlinked invocations from appending differently-resolved duplicates.
+if "_APP_ROOT_ON_PATH" not in os.environ:
+    ROOT = os.path.dirname(os.path.dirname(__file__))
+    if ROOT not in sys.path:
+        sys.path.append(ROOT)
+    os.environ["_APP_ROOT_ON_PATH"] = "1"
 
 import streamlit as st
 from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from src.app import run_review_workflow
 from src.tools import validate_repo_url, sanitize_text
 from src.logging_utils import get_logger
 
@@ -27,6 +33,71 @@ st.set_page_config(
     layout="wide",
 )
 
+
+@st.cache_resource(show_spinner=False)
+def get_workflow(model_name: str):
+    """
+    One workflow handle per model for the whole server process. Streamlit
+    reruns this script top-to-bottom on every widget interaction; caching
+    here means only the per-request inputs change between clicks instead of
+    re-resolving the pipeline each time. Keyed by model_name so switching
+    models still rebuilds.
+    """
+    from src.app import build_workflow
+
+    return build_workflow(model_name)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_and_analyze_cached(repo_url: str, model_name: str) -> dict:
+    """
+    Cached README fetch + agent analysis, keyed by (repo_url, model_name).
+    Repeat analyses of the same repo — the common case during HITL
+    iteration, where only the reviewer notes change — skip the network and
+    the agents entirely; only the cheap report composition reruns.
+    """
+    return get_workflow(model_name).analyze(repo_url)
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """One shared worker pool per server process for background analyses."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+def _run_job(job: dict, repo_url: str, model_name: str, hitl_notes: str, ctx) -> None:
+    """
+    Worker-thread body: run the workflow and append its events to the job
+    dict that the polling fragment renders from. The Streamlit script-run
+    context is attached so the cached helpers work off the script thread.
+    """
+    add_script_run_ctx(threading.current_thread(), ctx)
+    try:
+        workflow = get_workflow(model_name)
+        analysis = fetch_and_analyze_cached(repo_url, model_name)
+        for ev in workflow.stream(
+            repo_url,
+            human_feedback=hitl_notes,
+            analysis=analysis,
+            cancel=job["cancel"],
+        ):
+            job["events"].append(ev)
+            if "final" in ev:
+                job["result"] = ev["final"]
+            elif "error" in ev:
+                job["error"] = ev["error"]
+            elif "cancelled" in ev:
+                job["cancelled"] = True
+    except Exception as e:
+        logger.exception(f"UI worker error: {e}")
+        job["error"] = (
+            "An error occurred while analyzing the repository. "
+            "Please check your configuration and try again."
+        )
+    finally:
+        job["done"] = True
+
+
 st.title("🧠 Multi-Agent Publication Reviewer & Recommendation System")
 st.write(
     "Analyze a GitHub repository's README and receive AI-generated, "
@@ -48,43 +119,124 @@ st.sidebar.info(
     "Make sure your GOOGLE_API_KEY is set in a local .env file before running the app."
 )
 
+# Completed/in-flight jobs for this session, keyed by the inputs that
+# determine the result. Unrelated widget interactions rerun the script but
+# find their job here, so the previous output survives without re-running
+# anything.
+st.session_state.setdefault("runs", {})
+
 if st.button("🔍 Analyze Repository"):
     if not validate_repo_url(repo_url):
         st.error("Please enter a valid GitHub repo URL (https://github.com/owner/repo).")
     else:
-        with st.spinner("Running multi-agent analysis..."):
-            try:
-                result = run_review_workflow(
-                    repo_url=repo_url,
-                    human_feedback=hitl_notes,
-                    model_name=model_name,
-                )
-                final_text = result.get("final_recommendations", "")
-                keywords = result.get("keywords", [])
-
-                # Main layout
-                col1, col2 = st.columns([2, 1])
-
-                with col1:
-                    st.subheader("📋 Final Recommendations")
-                    st.write(sanitize_text(final_text, max_len=4500))
-
-                with col2:
-                    st.subheader("🔑 Extracted Keywords")
-                    if keywords:
-                        for k in keywords:
-                            st.markdown(f"- {k}")
-                    else:
-                        st.write("No keywords extracted.")
-
-                st.success("Analysis complete. Scroll to review the suggestions.")
-
-            except Exception as e:
-                logger.exception(f"UI error: {e}")
-                st.error(
-                    "An error occurred while analyzing the repository. "
-                    "Please check your configuration and try again."
-                )
+        key = (repo_url, model_name, hitl_notes)
+        cached_job = st.session_state["runs"].get(key)
+        if (
+            cached_job is not None
+            and not cached_job["error"]
+            and not cached_job["cancelled"]
+        ):
+            # same repo/model/notes already analyzed (or in flight) this
+            # session — just show it again
+            st.session_state["job"] = cached_job
+        else:
+            # Hand the workflow to the shared executor so this script run
+            # (and the whole session) stays responsive; the fragment below
+            # polls the job and renders partial results as events accumulate.
+            # The cancel event travels with the job so the worker stops at
+            # the next stage boundary once the user gives up on the run.
+            job = {
+                "events": [],
+                "done": False,
+                "result": None,
+                "error": None,
+                "cancelled": False,
+                "cancel": threading.Event(),
+            }
+            st.session_state["job"] = job
+            st.session_state["runs"][key] = job
+            get_executor().submit(
+                _run_job, job, repo_url, model_name, hitl_notes, get_script_run_ctx()
+            )
+
+
+# Poll only while a job is actually in flight. The interval is computed per
+# script run: finished (or absent) jobs get run_every=None, so idle sessions
+# render the results once instead of rerunning the fragment forever.
+_POLL_JOB = st.session_state.get("job")
+_POLL_SEC = 0.3 if _POLL_JOB is not None and not _POLL_JOB["done"] else None
+
+
+@st.fragment(run_every=_POLL_SEC)
+def render_job() -> None:
+    """Poll the in-flight (or finished) analysis job and render its events.
+    Only this fragment reruns on the poll interval, not the whole script."""
+    job = st.session_state.get("job")
+    if job is None:
+        return
+
+    buf = []
+    keywords = None
+    stages = []
+    for ev in list(job["events"]):
+        if "delta" in ev:
+            buf.append(ev["delta"])
+        elif "keywords" in ev:
+            keywords = ev["keywords"]
+        elif "stage" in ev:
+            stages.append(ev["stage"])
+
+    # live per-stage progress instead of an opaque spinner: each stage event
+    # from the workflow shows up here as soon as the worker emits it
+    if job["cancelled"]:
+        status_state, label = "error", "Analysis cancelled"
+    elif job["error"]:
+        status_state, label = "error", "Analysis failed"
+    elif job["done"]:
+        status_state, label = "complete", "Analysis complete"
+    else:
+        status_state = "running"
+        label = stages[-1] if stages else "Starting multi-agent analysis..."
+    with st.status(label, state=status_state, expanded=not job["done"]):
+        for s in stages:
+            st.write(s)
+
+    if not job["done"] and st.button("⏹️ Cancel"):
+        # worker checks the event between stages and between report lines,
+        # so the run stops shortly after without wasting further work
+        job["cancel"].set()
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.subheader("📋 Final Recommendations")
+        if buf:
+            st.write(sanitize_text("".join(buf), max_len=4500))
+
+    with col2:
+        st.subheader("🔑 Extracted Keywords")
+        if keywords:
+            # one markdown element for the whole list: a single delta
+            # message/DOM update instead of one per keyword
+            st.markdown(
+                "\n".join(f"- {sanitize_text(k, max_len=120)}" for k in keywords)
+            )
+        elif keywords is not None:
+            st.write("No keywords extracted.")
+
+    if job["cancelled"]:
+        st.info("Analysis cancelled. Click Analyze Repository to start a fresh run.")
+    elif job["error"]:
+        st.error(job["error"])
+    elif job["done"]:
+        st.success("Analysis complete. Scroll to review the suggestions.")
+
+    if _POLL_SEC is not None and job["done"]:
+        # the job finished while this fragment was polling: one full rerun
+        # redefines the fragment with run_every=None, which stops the polling
+        st.rerun(scope="app")
+
+
+render_job()
 
 # Footer
 st.markdown("---")